@@ -13,24 +13,44 @@ Features:
  - Export to CSV
 """
 
+from __future__ import annotations
+
+import calendar
+import collections
+import copy
+import hashlib
 import json
+import mmap
+import operator
 import os
+import re
 import shutil
+import sys
+import time
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Optional, List, Dict
 import csv
 
+try:
+    import orjson  # optional, much faster serializer
+except ImportError:
+    orjson = None
+
 # -------------------------
 # Configuration & Defaults
 # -------------------------
 DATA_FILE = "to_do.json"
 CONFIG_FILE = "config.json"
 BACKUP_DIR = "backups"
+MMAP_THRESHOLD = 1 << 20  # data files larger than this are parsed via mmap
 DEFAULT_CONFIG = {
     "autosave": True,
     "backup_on_save": True,
     "backup_keep": 10,
+    "backup_interval": 300,  # min seconds between automatic backups on save
     "color": True,
     "default_sort": {"key": "date", "reverse": False},
     "undo_depth": 10,
@@ -72,48 +92,68 @@ def save_config(cfg: dict):
         json.dump(cfg, f, indent=4)
 
 CFG = load_config()
+# no ANSI codes when output is piped or redirected
+_COLOR_ENABLED = CFG.get("color", True) and sys.stdout.isatty()
 
 def colored(text: str, color_code: str) -> str:
-    if not CFG.get("color", True):
+    if not _COLOR_ENABLED:
         return text
     return f"{color_code}{text}{Colors.RESET}"
 
 def ensure_backup_dir():
     os.makedirs(BACKUP_DIR, exist_ok=True)
 
-def make_backup(data):
+# backup filenames on disk, oldest first; filled on the first backup
+_BACKUP_Q: Optional[collections.deque] = None
+
+def remove_backup(fname: str):
+    try:
+        os.remove(os.path.join(BACKUP_DIR, fname))
+    except Exception:
+        pass
+
+def make_backup(serialized: bytes):
+    # takes the output of serialize_tasks() so saves only encode once
+    global _BACKUP_Q
     if not CFG.get("backup_on_save", True):
         return
     ensure_backup_dir()
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    fname = f"to_do_backup_{ts}.json"
+    keep = max(CFG.get("backup_keep", 10), 0)
+    if _BACKUP_Q is None:
+        # scan the directory once; later backups are tracked in memory.
+        # order by mtime: older datetime-stamped names don't sort with ns stamps
+        backups = sorted(os.listdir(BACKUP_DIR),
+                         key=lambda f: os.path.getmtime(os.path.join(BACKUP_DIR, f)))
+        for old in backups[: max(len(backups) - keep, 0)]:
+            remove_backup(old)
+        _BACKUP_Q = collections.deque(backups[len(backups) - keep:], maxlen=keep)
+    fname = f"to_do_backup_{time.time_ns()}.json"
     path = os.path.join(BACKUP_DIR, fname)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=4)
-    # prune old backups
-    backups = sorted(os.listdir(BACKUP_DIR))
-    keep = CFG.get("backup_keep", 10)
-    if len(backups) > keep:
-        for old in backups[: len(backups) - keep]:
-            try:
-                os.remove(os.path.join(BACKUP_DIR, old))
-            except Exception:
-                pass
+    with open(path, "wb") as f:
+        f.write(serialized)
+    if _BACKUP_Q and _BACKUP_Q[-1] == fname:
+        return  # same-timestamp backup overwrote the newest file
+    # prune the oldest backup once the ring is full
+    if _BACKUP_Q.maxlen and len(_BACKUP_Q) == _BACKUP_Q.maxlen:
+        remove_backup(_BACKUP_Q[0])
+    elif not _BACKUP_Q.maxlen:
+        remove_backup(fname)
+    _BACKUP_Q.append(fname)
 
 # -------------------------
 # Storage and undo stack
 # -------------------------
-UNDO_STACK: List[List[dict]] = []
+UNDO_STACK: List[List[Task]] = []
 
-def push_undo(state: List[dict]):
+def push_undo(state: List[Task]):
     depth = CFG.get("undo_depth", 10)
-    # store deep copy
-    copy_state = json.loads(json.dumps(state))
+    # task values are immutable, so a per-task shallow copy is a full snapshot
+    copy_state = [copy.copy(t) for t in state]
     UNDO_STACK.append(copy_state)
     if len(UNDO_STACK) > depth:
         UNDO_STACK.pop(0)
 
-def undo(last_state_holder: dict) -> Optional[List[dict]]:
+def undo(last_state_holder: dict) -> Optional[List[Task]]:
     # returns restored state or None
     if not UNDO_STACK:
         print("Nothing to undo.")
@@ -123,61 +163,114 @@ def undo(last_state_holder: dict) -> Optional[List[dict]]:
     print("Undo successful.")
     return restored
 
-def load_data() -> List[dict]:
+def read_data_file():
+    with open(DATA_FILE, "rb") as f:
+        # stdlib json can't parse from an mmap without copying it to bytes first
+        if orjson is None:
+            return json.load(f)
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            # parse straight from the mapped pages, no file-sized bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+                return orjson.loads(buf)
+        return orjson.loads(f.read())
+
+def keep_bad_copy(reason: str):
+    # the next save would overwrite what couldn't be loaded, so keep the original
+    bad_copy = DATA_FILE + ".bad"
+    try:
+        shutil.copy(DATA_FILE, bad_copy)
+        print(f"{reason}; original kept as {bad_copy}.")
+    except Exception as e:
+        print(f"{reason}; could not copy original:", e)
+
+def load_data() -> List[Task]:
     if not os.path.exists(DATA_FILE):
         return []
     try:
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-        # compat: if old list-of-lists, convert
-        if data and isinstance(data[0], list):
-            converted = []
-            for row in data:
-                # expected [item, date, priority] optionally
-                item = row[0] if len(row) > 0 else ""
-                d = row[1] if len(row) > 1 else ""
-                p = row[2] if len(row) > 2 else "low"
-                converted.append({
-                    "id": str(uuid.uuid4()),
-                    "item": item,
-                    "date": d,
-                    "priority": p,
-                    "completed": False,
-                    "repeat": None,
-                    "notes": "",
-                    "created": datetime.now().isoformat()
-                })
-            save_data(converted)
-            return converted
-        return data
+        data = read_data_file()
     except Exception:
+        data = None
+    if not isinstance(data, list):
+        keep_bad_copy(f"Could not read {DATA_FILE}")
         return []
+    tasks, skipped, converted = [], [], False
+    for row in data:
+        # compat: old list rows are [item, date, priority], trailing ones optional
+        if isinstance(row, list):
+            row = dict(zip(("item", "date", "priority"), row))
+            converted = True
+        if isinstance(row, dict):
+            tasks.append(Task.from_dict(row))
+        else:
+            skipped.append(row)
+    if skipped:
+        keep_bad_copy(f"Skipped {len(skipped)} unreadable row(s) in {DATA_FILE}")
+    if converted:
+        save_data(tasks)
+    return tasks
+
+def serialize_tasks(tasks: List[Task]) -> bytes:
+    """Compact JSON bytes for tasks (derived fields stripped)."""
+    data = [t.to_dict() for t in tasks]
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
-def save_data(data: List[dict]):
+# digest of the last bytes written to DATA_FILE, to skip no-op saves
+_LAST_HASH: Optional[bytes] = None
+# time.monotonic() of the last automatic backup
+_LAST_BACKUP: Optional[float] = None
+
+def save_data(data: List[Task]):
+    global _LAST_HASH, _LAST_BACKUP
     try:
-        make_backup(data)
-        with open(DATA_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+        serialized = serialize_tasks(data)
+        h = hashlib.blake2b(serialized, digest_size=16).digest()
+        if h == _LAST_HASH:
+            return
+        now = time.monotonic()
+        if _LAST_BACKUP is None or now - _LAST_BACKUP >= CFG.get("backup_interval", 300):
+            make_backup(serialized)
+            _LAST_BACKUP = now
+        # write-then-rename so a crash never leaves a truncated DATA_FILE
+        tmp = DATA_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(serialized)
+        os.replace(tmp, DATA_FILE)
+        _LAST_HASH = h
     except Exception as e:
         print("Error saving data:", e)
 
 # -------------------------
 # Date parsing and helpers
 # -------------------------
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_DMY_DATE_RE = re.compile(r"^(\d{1,2})[-/](\d{1,2})[-/](\d{4})$")
+
+@lru_cache(maxsize=4096)
 def parse_date(s: str) -> Optional[date]:
     """Accepts 'YYYY-MM-DD' or 'DD/MM/YYYY' or empty string. Returns date or None."""
     s = s.strip()
     if not s:
         return None
-    for fmt in ("%Y-%m-%d", "%d/%m/%Y"):
-        try:
-            return datetime.strptime(s, fmt).date()
-        except Exception:
-            pass
-    # try forgiving parse: accept dd-mm-yyyy too
+    m = _ISO_DATE_RE.match(s)
+    if m:
+        if len(s) == 10:
+            # canonical YYYY-MM-DD, the stored form: use the C-level parser
+            try:
+                return date.fromisoformat(s)
+            except ValueError:
+                return None
+        y, mo, d = m.groups()
+    else:
+        # forgiving: accept dd-mm-yyyy too
+        m = _DMY_DATE_RE.match(s)
+        if not m:
+            return None
+        d, mo, y = m.groups()
     try:
-        return datetime.strptime(s.replace("-", "/"), "%d/%m/%Y").date()
-    except Exception:
+        return date(int(y), int(mo), int(d))
+    except ValueError:
         return None
 
 def format_date_for_display(d: Optional[date]) -> str:
@@ -191,6 +284,66 @@ def days_until(d: Optional[date]) -> Optional[int]:
 # -------------------------
 # Repeat rule handling
 # -------------------------
+_DAY_MAP = {"mon":0,"monday":0,"tue":1,"tuesday":1,"wed":2,"wednesday":2,
+            "thu":3,"thursday":3,"fri":4,"friday":4,"sat":5,"saturday":5,
+            "sun":6,"sunday":6}
+_EVERY_N_RE = re.compile(r"^every\s+(\d+)\s+day")
+
+# integer rule codes produced by compile_repeat_rule()
+REPEAT_DAILY, REPEAT_WEEKLY, REPEAT_MONTHLY, REPEAT_EVERY_N, REPEAT_WEEKDAYS = range(5)
+
+@lru_cache(maxsize=256)
+def compile_repeat_rule(rule: str) -> Optional[tuple]:
+    """Turn a repeat rule string into (code, arg), or None if unrecognized.
+    arg is N for 'every N days' and a weekday bitmask (bit 0 = Monday) for weekday lists.
+    """
+    rule = rule.strip().lower()
+    if rule == "daily":
+        return REPEAT_DAILY, 0
+    if rule == "weekly":
+        return REPEAT_WEEKLY, 0
+    if rule == "monthly":
+        return REPEAT_MONTHLY, 0
+    m = _EVERY_N_RE.match(rule)
+    if m:
+        return REPEAT_EVERY_N, int(m.group(1))
+    # weekdays like "mon,tue"
+    if "," in rule or rule in _DAY_MAP:
+        mask = 0
+        for t in rule.split(","):
+            t = t.strip()
+            if t in _DAY_MAP:
+                mask |= 1 << _DAY_MAP[t]
+        if mask:
+            return REPEAT_WEEKDAYS, mask
+    return None
+
+def next_ordinal(ordinal: int, code: int, arg: int) -> int:
+    """Next occurrence as a proleptic Gregorian ordinal (see date.toordinal)."""
+    if code == REPEAT_DAILY:
+        return ordinal + 1
+    if code == REPEAT_WEEKLY:
+        return ordinal + 7
+    if code == REPEAT_EVERY_N:
+        return ordinal + arg
+    if code == REPEAT_MONTHLY:
+        # add 1 month, clamping the day to the month's length
+        d = date.fromordinal(ordinal)
+        month = d.month + 1
+        year = d.year
+        if month > 12:
+            month = 1
+            year += 1
+        day = min(d.day, calendar.monthrange(year, month)[1])
+        return date(year, month, day).toordinal()
+    # REPEAT_WEEKDAYS: first later day whose bit is set in the mask
+    weekday = (ordinal - 1) % 7  # ordinal 1 (0001-01-01) is a Monday
+    for i in range(1, 8):
+        if arg >> ((weekday + i) % 7) & 1:
+            return ordinal + i
+    raise ValueError(f"empty weekday mask: {arg}")
+
+@lru_cache(maxsize=1024)
 def next_date_for_repeat(d: Optional[date], rule: Optional[str]) -> Optional[date]:
     """Given a date and repeat rule, compute next occurrence date.
     Supported rules:
@@ -203,162 +356,179 @@ def next_date_for_repeat(d: Optional[date], rule: Optional[str]) -> Optional[dat
     """
     if d is None or not rule:
         return None
-    rule = rule.strip().lower()
-    if rule == "daily":
-        return d + timedelta(days=1)
-    if rule == "weekly":
-        return d + timedelta(weeks=1)
-    if rule == "monthly":
-        # simple approach: add 1 month by incrementing month, keeping day when possible
-        try:
-            month = d.month + 1
-            year = d.year
-            if month > 12:
-                month = 1
-                year += 1
-            day = min(d.day, [31,
-                              29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28,
-                              31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month-1])
-            return date(year, month, day)
-        except Exception:
-            return d + timedelta(days=30)
-    if rule.startswith("every "):
-        # try "every N days"
-        parts = rule.split()
-        if len(parts) >= 3 and parts[2].startswith("day"):
-            try:
-                n = int(parts[1])
-                return d + timedelta(days=n)
-            except Exception:
-                pass
-    # weekdays like "mon,tue"
-    day_map = {"mon":0,"monday":0,"tue":1,"tuesday":1,"wed":2,"wednesday":2,
-               "thu":3,"thursday":3,"fri":4,"friday":4,"sat":5,"saturday":5,
-               "sun":6,"sunday":6}
-    if "," in rule or rule in day_map:
-        try:
-            tokens = [t.strip() for t in rule.split(",")]
-            weekdays = [day_map[t] for t in tokens if t in day_map]
-            if not weekdays:
-                return None
-            # find the next date after d that matches any weekday
-            for i in range(1, 15):  # look up to two weeks
-                candidate = d + timedelta(days=i)
-                if candidate.weekday() in weekdays:
-                    return candidate
-        except Exception:
-            return None
-    return None
+    compiled = compile_repeat_rule(rule)
+    if compiled is None:
+        return None
+    return date.fromordinal(next_ordinal(d.toordinal(), *compiled))
 
 # -------------------------
 # Task helpers
 # -------------------------
-def new_task(item: str, date_str: str = "", priority: str = "low", repeat: Optional[str]=None, notes: str="") -> dict:
+TASK_FIELDS = ("id","item","date","priority","completed","repeat","notes","created")
+
+@dataclass(slots=True)
+class Task:
+    """A to-do item. TASK_FIELDS plus any unknown keys from the file (_extra) are stored;
+    the other underscore fields are derived."""
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    item: str = ""
+    date: str = ""
+    priority: str = "low"
+    completed: bool = False
+    repeat: Optional[str] = None
+    notes: str = ""
+    created: str = field(default_factory=lambda: datetime.now().isoformat())
+    _date: Optional[date] = field(default=None, repr=False, compare=False)
+    _item_lc: str = field(default="", repr=False, compare=False)
+    # keys from the file this version doesn't know about, written back on save
+    _extra: dict = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self.refresh()
+
+    def refresh(self):
+        """(Re)compute the derived fields after item or date changes."""
+        # hand-edited files may hold non-string dates; treat those as undated
+        self._date = parse_date(self.date) if isinstance(self.date, str) else None
+        self._item_lc = self.item.lower()
+
+    @classmethod
+    def from_dict(cls, row: dict) -> Task:
+        # coerce hand-edited values so one odd field can't fail the whole load
+        kwargs = {}
+        for k in TASK_FIELDS:
+            v = row.get(k)
+            if v is None:
+                continue  # missing or null: use the field default
+            if k == "completed":
+                v = bool(v)
+            elif not isinstance(v, str):
+                v = str(v)
+            kwargs[k] = v
+        extra = {k: v for k, v in row.items() if k not in TASK_FIELDS}
+        return cls(**kwargs, _extra=extra)
+
+    def to_dict(self) -> dict:
+        d = {k: getattr(self, k) for k in TASK_FIELDS}
+        if self._extra:
+            d.update(self._extra)
+        return d
+
+def new_task(item: str, date_str: str = "", priority: str = "low", repeat: Optional[str]=None, notes: str="") -> Task:
     d = parse_date(date_str)
-    return {
-        "id": str(uuid.uuid4()),
-        "item": item.strip(),
-        "date": format_date_for_display(d) if d else "",
-        "priority": priority.lower() if priority else "low",
-        "completed": False,
-        "repeat": repeat,
-        "notes": notes,
-        "created": datetime.now().isoformat()
-    }
+    return Task(
+        item=item.strip(),
+        date=format_date_for_display(d) if d else "",
+        priority=priority.lower() if priority else "low",
+        repeat=repeat,
+        notes=notes,
+    )
+
+# lowercased item names, for O(1) duplicate checks in add_item
+_ITEM_INDEX: set = set()
+
+def rebuild_item_index(tasks: List[Task]):
+    # repeat occurrences share a name, so removals rebuild instead of discarding
+    _ITEM_INDEX.clear()
+    _ITEM_INDEX.update(t._item_lc for t in tasks)
 
 # -------------------------
 # Display formatting
 # -------------------------
-def color_priority(p: str) -> str:
+def color_priority(p: str, width: int = 0) -> str:
+    # pads before coloring so ANSI codes don't count towards the width
     p = (p or "").lower()
+    text = f"{p or 'low':<{width}}"
     if p == "high":
-        return colored(p, Colors.RED)
+        return colored(text, Colors.RED)
     if p == "medium":
-        return colored(p, Colors.YELLOW)
-    return colored(p or "low", Colors.GREEN)
+        return colored(text, Colors.YELLOW)
+    return colored(text, Colors.GREEN)
 
 def status_text(done: bool) -> str:
     return "✔" if done else " "
 
-def build_table_rows(tasks: List[dict]) -> List[List[str]]:
+def build_table_rows(tasks: List[Task]) -> List[List[str]]:
     rows = []
     for t in tasks:
-        d = parse_date(t.get("date","")) if t.get("date") else None
-        days = days_until(d) if d else None
-        # highlight overdue/today via color in priority cell or item
-        item_text = t["item"]
-        if d:
-            if days is not None and days < 0:
-                item_text = colored(item_text, Colors.RED)
-            elif days == 0:
-                item_text = colored(item_text, Colors.CYAN)
+        # plain text only: widths are measured from these cells
         rows.append([
-            t["item"],
-            t.get("date",""),
-            t.get("priority",""),
-            "✔" if t.get("completed") else "",
-            t.get("repeat") or "",
-            t.get("notes","")
+            t.item,
+            t.date,
+            t.priority,
+            "✔" if t.completed else "",
+            t.repeat or "",
+            t.notes
         ])
     return rows
 
-def print_table(tasks: List[dict]):
+@lru_cache(maxsize=32)
+def row_renderer(widths: tuple):
+    """Compile a row-rendering function specialized for these column widths.
+
+    The widths are baked into the generated f-string, so rendering a row does no
+    per-cell format-spec work. Cached per widths until the table shape changes.
+    """
+    w0, w1, w2, w3, w4, w5 = widths
+    src = f"""
+def render_rows(tasks, lines, today):
+    append = lines.append
+    for i, t in enumerate(tasks, 1):
+        # pad the raw text first, then color, so alignment ignores ANSI codes
+        item = f"{{t.item:<{w0}}}"
+        d = t._date
+        if d is not None:
+            # overdue/today highlight item name
+            days = (d - today).days
+            if days < 0:
+                item = colored(item, Colors.RED)
+            elif days == 0:
+                item = colored(item, Colors.CYAN)
+        priority = color_priority(t.priority, {w2}) if t.priority else "{' ' * w2}"
+        done = "✔" if t.completed else ""
+        append(f"{{i:>2}}. {{item}} | {{t.date:<{w1}}} | {{priority}} | {{done:<{w3}}} | {{t.repeat or '':<{w4}}} | {{t.notes or '':<{w5}}}")
+"""
+    namespace = {"colored": colored, "color_priority": color_priority, "Colors": Colors}
+    exec(src, namespace)
+    return namespace["render_rows"]
+
+def print_table(tasks: List[Task]):
     rows = build_table_rows(tasks)
     if not rows:
         print("Nothing to display.\n")
         return
 
     HEADERS = ["Item", "Date", "Priority", "Done", "Repeat", "Notes"]
-    widths = [
-        max(len(HEADERS[0]), *(len(str(r[0])) for r in rows)),
-        max(len(HEADERS[1]), *(len(str(r[1])) for r in rows)),
-        max(len(HEADERS[2]), *(len(str(r[2])) for r in rows)),
-        max(len(HEADERS[3]), *(len(str(r[3])) for r in rows)),
-        max(len(HEADERS[4]), *(len(str(r[4])) for r in rows)),
-        max(len(HEADERS[5]), *(len(str(r[5])) for r in rows)),
-    ]
+    # one pass over the rows; the Done cell ("✔" or "") never exceeds its header
+    widths = [len(h) for h in HEADERS]
+    for r in rows:
+        for i in (0, 1, 2, 4, 5):
+            n = len(str(r[i]))
+            if n > widths[i]:
+                widths[i] = n
 
     sep = " | "
-    header_row = f"{HEADERS[0]:<{widths[0]}}{sep}{HEADERS[1]:<{widths[1]}}{sep}{HEADERS[2]:<{widths[2]}}{sep}{HEADERS[3]:<{widths[3]}}{sep}{HEADERS[4]:<{widths[4]}}{sep}{HEADERS[5]:<{widths[5]}}"
-    print()
-    print(header_row)
-    print("-" * (sum(widths) + len(sep) * 5))
-
-    for i, t in enumerate(tasks, 1):
-        d = parse_date(t.get("date","")) if t.get("date") else None
-        days = days_until(d) if d else None
-
-        item_display = t["item"]
-        priority_display = t.get("priority","")
-        if priority_display:
-            priority_display = color_priority(priority_display)
-        # overdue/today highlight item name
-        if d:
-            if days is not None and days < 0:
-                item_display = colored(item_display, Colors.RED)
-            elif days == 0:
-                item_display = colored(item_display, Colors.CYAN)
-
-        done_display = "✔" if t.get("completed") else ""
-
-        print(f"{i:>2}. {item_display:<{widths[0]}}{sep}{t.get('date',''):<{widths[1]}}{sep}{priority_display:<{widths[2]}}{sep}{done_display:<{widths[3]}}{sep}{(t.get('repeat') or ''):<{widths[4]}}{sep}{(t.get('notes') or ''):<{widths[5]}}")
-
-    print()
+    row_fmt = sep.join(f"{{:<{w}}}" for w in widths)
+    # collect the whole table and write it in one call
+    lines = ["", row_fmt.format(*HEADERS), "-" * (sum(widths) + len(sep) * 5)]
+    row_renderer(tuple(widths))(tasks, lines, date.today())
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # -------------------------
 # Commands
 # -------------------------
-def list_all(tasks: List[dict], show_completed: bool = True):
+def list_all(tasks: List[Task], show_completed: bool = True):
     if not show_completed:
-        tasks = [t for t in tasks if not t.get("completed")]
+        tasks = [t for t in tasks if not t.completed]
     print_table(tasks)
 
-def add_item(tasks: List[dict]):
+def add_item(tasks: List[Task]):
     item = input("Item to add > ").strip()
     if not item:
         print("Empty item; cancelled.")
         return tasks
-    if any(t["item"].lower() == item.lower() for t in tasks):
+    if item.lower() in _ITEM_INDEX:
         print("Item already exists.")
         return tasks
     date_str = input("Due date (YYYY-MM-DD or DD/MM/YYYY) [optional] > ").strip()
@@ -374,12 +544,13 @@ def add_item(tasks: List[dict]):
     push_undo(tasks)
     t = new_task(item, date_str, priority, repeat, notes)
     tasks.append(t)
+    _ITEM_INDEX.add(t._item_lc)
     if CFG.get("autosave", True):
         save_data(tasks)
     print("Item added.")
     return tasks
 
-def find_task_by_identifier(tasks: List[dict], identifier: str) -> Optional[dict]:
+def find_task_by_identifier(tasks: List[Task], identifier: str) -> Optional[Task]:
     """Identifier can be numeric index (1-based), full/partial name, or id."""
     identifier = identifier.strip()
     if not identifier:
@@ -389,57 +560,62 @@ def find_task_by_identifier(tasks: List[dict], identifier: str) -> Optional[dict
         idx = int(identifier) - 1
         if 0 <= idx < len(tasks):
             return tasks[idx]
-    # id exact
+    # id exact (wins immediately) and name partial (case-insensitive) in one pass
+    ident_lc = identifier.lower()
+    matches = []
     for t in tasks:
-        if t.get("id") == identifier:
+        if t.id == identifier:
             return t
-    # name partial (case-insensitive)
-    matches = [t for t in tasks if identifier.lower() in t["item"].lower()]
+        if ident_lc in t._item_lc:
+            matches.append(t)
     if len(matches) == 1:
         return matches[0]
     if len(matches) > 1:
         print("Multiple matches found:")
         for i, m in enumerate(matches, 1):
-            print(f"  {i}. {m['item']} (id: {m['id']})")
+            print(f"  {i}. {m.item} (id: {m.id})")
         print("Be more specific or use numeric index.")
         return None
     return None
 
-def remove_item(tasks: List[dict]):
+def remove_item(tasks: List[Task]):
     identifier = input("Item to remove (index/name/id) > ").strip()
     t = find_task_by_identifier(tasks, identifier)
     if not t:
         print("Item not found or ambiguous.")
         return tasks
-    confirm = input(f"Delete '{t['item']}'? (y/n) > ").strip().lower()
+    confirm = input(f"Delete '{t.item}'? (y/n) > ").strip().lower()
     if confirm not in ("y","yes"):
         print("Cancelled.")
         return tasks
     push_undo(tasks)
-    tasks = [x for x in tasks if x["id"] != t["id"]]
+    tasks = [x for x in tasks if x.id != t.id]
+    rebuild_item_index(tasks)
     if CFG.get("autosave", True):
         save_data(tasks)
     print("Deleted.")
     return tasks
 
-def rename_item(tasks: List[dict]):
+def rename_item(tasks: List[Task]):
     identifier = input("Which item to rename (index/name/id) > ").strip()
     t = find_task_by_identifier(tasks, identifier)
     if not t:
         print("Not found.")
         return tasks
-    new_name = input(f"Rename '{t['item']}' to > ").strip()
+    new_name = input(f"Rename '{t.item}' to > ").strip()
     if not new_name:
         print("Empty name; cancelled.")
         return tasks
     push_undo(tasks)
-    t["item"] = new_name
+    t.item = new_name
+    t.refresh()
+    rebuild_item_index(tasks)
     if CFG.get("autosave", True):
         save_data(tasks)
     print("Renamed.")
     return tasks
 
-def change_priority(tasks: List[dict]):
+def change_priority(tasks: List[Task]):
     identifier = input("Change priority for (index/name/id) > ").strip()
     t = find_task_by_identifier(tasks, identifier)
     if not t:
@@ -450,13 +626,13 @@ def change_priority(tasks: List[dict]):
         print("Invalid priority.")
         return tasks
     push_undo(tasks)
-    t["priority"] = new_p
+    t.priority = new_p
     if CFG.get("autosave", True):
         save_data(tasks)
     print("Priority updated.")
     return tasks
 
-def change_date(tasks: List[dict]):
+def change_date(tasks: List[Task]):
     identifier = input("Change date for (index/name/id) > ").strip()
     t = find_task_by_identifier(tasks, identifier)
     if not t:
@@ -467,34 +643,35 @@ def change_date(tasks: List[dict]):
         print("Invalid date format.")
         return tasks
     push_undo(tasks)
-    t["date"] = new_date or ""
+    t.date = new_date or ""
+    t.refresh()
     if CFG.get("autosave", True):
         save_data(tasks)
     print("Date updated.")
     return tasks
 
-def toggle_done(tasks: List[dict]):
+def toggle_done(tasks: List[Task]):
     identifier = input("Mark done/undone for (index/name/id) > ").strip()
     t = find_task_by_identifier(tasks, identifier)
     if not t:
         print("Not found.")
         return tasks
     push_undo(tasks)
-    t["completed"] = not t.get("completed", False)
+    t.completed = not t.completed
     # handle repeating tasks: if marked done and has repeat, create next occurrence
-    if t["completed"] and t.get("repeat"):
-        d = parse_date(t.get("date",""))
-        next_d = next_date_for_repeat(d, t.get("repeat"))
+    if t.completed and t.repeat:
+        d = t._date
+        next_d = next_date_for_repeat(d, t.repeat)
         if next_d:
-            new = new_task(t["item"], next_d.isoformat(), t.get("priority","low"), t.get("repeat"), t.get("notes",""))
+            new = new_task(t.item, next_d.isoformat(), t.priority, t.repeat, t.notes)
             tasks.append(new)
             print("Next occurrence created for repeating task.")
     if CFG.get("autosave", True):
         save_data(tasks)
-    print(f"Marked {'done' if t['completed'] else 'not done'}.")
+    print(f"Marked {'done' if t.completed else 'not done'}.")
     return tasks
 
-def edit_notes(tasks: List[dict]):
+def edit_notes(tasks: List[Task]):
     identifier = input("Edit notes for (index/name/id) > ").strip()
     t = find_task_by_identifier(tasks, identifier)
     if not t:
@@ -502,40 +679,37 @@ def edit_notes(tasks: List[dict]):
         return tasks
     new_notes = input("New notes [empty to clear] > ").strip()
     push_undo(tasks)
-    t["notes"] = new_notes
+    t.notes = new_notes
     if CFG.get("autosave", True):
         save_data(tasks)
     print("Notes updated.")
     return tasks
 
-def search_tasks(tasks: List[dict]):
+def search_tasks(tasks: List[Task]):
     q = input("Search query (keyword in name/notes) > ").strip().lower()
     if not q:
         print("Empty query.")
         return
-    found = [t for t in tasks if q in t["item"].lower() or q in (t.get("notes","").lower())]
+    found = [t for t in tasks if q in t._item_lc or q in t.notes.lower()]
     if not found:
         print("No results.")
         return
     print_table(found)
 
-def sort_tasks(tasks: List[dict]):
+def sort_tasks(tasks: List[Task]):
     print("Sort by:\n 1: name\n 2: date\n 3: priority\n 4: done\n 5: created\n  (enter to cancel)")
     choice = input("> ").strip()
     if choice == "1":
-        tasks.sort(key=lambda t: t["item"].lower())
+        tasks.sort(key=lambda t: t._item_lc)
     elif choice == "2":
-        def date_key(t):
-            pd = parse_date(t.get("date",""))
-            return pd or date.max
-        tasks.sort(key=date_key)
+        tasks.sort(key=lambda t: t._date or date.max)
     elif choice == "3":
         order = {"high":0,"medium":1,"low":2}
-        tasks.sort(key=lambda t: order.get(t.get("priority","low"), 3))
+        tasks.sort(key=lambda t: order.get(t.priority, 3))
     elif choice == "4":
-        tasks.sort(key=lambda t: t.get("completed", False))
+        tasks.sort(key=lambda t: t.completed)
     elif choice == "5":
-        tasks.sort(key=lambda t: t.get("created",""))
+        tasks.sort(key=lambda t: t.created)
     else:
         print("Cancelled.")
         return tasks
@@ -544,20 +718,20 @@ def sort_tasks(tasks: List[dict]):
     print("Sorted.")
     return tasks
 
-def export_csv(tasks: List[dict]):
+def export_csv(tasks: List[Task]):
     fname = input("CSV filename to create [tasks_export.csv] > ").strip() or "tasks_export.csv"
+    get_row = operator.attrgetter(*TASK_FIELDS)
     try:
-        with open(fname, "w", newline='') as csvfile:
+        with open(fname, "w", newline='', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(["id","item","date","priority","completed","repeat","notes","created"])
-            for t in tasks:
-                writer.writerow([t.get(k,"") for k in ("id","item","date","priority","completed","repeat","notes","created")])
+            writer.writerow(TASK_FIELDS)
+            writer.writerows(map(get_row, tasks))
         print(f"Exported to {fname}")
     except Exception as e:
         print("Export failed:", e)
 
-def clear_completed(tasks: List[dict]):
-    completed = [t for t in tasks if t.get("completed")]
+def clear_completed(tasks: List[Task]):
+    completed = [t for t in tasks if t.completed]
     if not completed:
         print("No completed tasks to clear.")
         return tasks
@@ -566,7 +740,8 @@ def clear_completed(tasks: List[dict]):
         print("Cancelled.")
         return tasks
     push_undo(tasks)
-    tasks = [t for t in tasks if not t.get("completed")]
+    tasks = [t for t in tasks if not t.completed]
+    rebuild_item_index(tasks)
     if CFG.get("autosave", True):
         save_data(tasks)
     print("Completed tasks cleared.")
@@ -580,32 +755,33 @@ def toggle_autosave():
     save_config(CFG)
     print("Autosave:", "ON" if CFG["autosave"] else "OFF")
 
-def undo_command(tasks: List[dict]):
+def undo_command(tasks: List[Task]):
     restored = undo({})
     if restored is not None:
+        rebuild_item_index(restored)
         return restored
     return tasks
 
 # -------------------------
 # Startup notifications
 # -------------------------
-def notify_startup(tasks: List[dict]):
+def notify_startup(tasks: List[Task]):
     reminder_days = CFG.get("reminder_days", 3)
     today = date.today()
-    due_today = []
-    overdue = []
-    upcoming = []
+    overdue, due_today, upcoming = [], [], []
     for t in tasks:
-        d = parse_date(t.get("date","")) if t.get("date") else None
-        if not d:
+        if t.completed:
+            continue
+        d = t._date
+        if d is None:
             continue
         days = (d - today).days
-        if days < 0 and not t.get("completed"):
+        if days < 0:
             overdue.append(t)
-        elif days == 0 and not t.get("completed"):
+        elif days == 0:
             due_today.append(t)
-        elif 0 < days <= reminder_days and not t.get("completed"):
-            upcoming.append((t, days))
+        elif days <= reminder_days:
+            upcoming.append(t)
     if overdue:
         print(colored("OVERDUE tasks:", Colors.RED))
         print_table(overdue[:10])
@@ -614,13 +790,14 @@ def notify_startup(tasks: List[dict]):
         print_table(due_today[:10])
     if upcoming:
         print(colored(f"Due in next {reminder_days} days:", Colors.MAGENTA))
-        print_table([t for t, _ in upcoming][:10])
+        print_table(upcoming[:10])
 
 # -------------------------
 # Main loop
 # -------------------------
 def main():
     tasks = load_data()
+    rebuild_item_index(tasks)
     # apply default sort if configured
     ds = CFG.get("default_sort", {})
     if ds:
@@ -628,9 +805,9 @@ def main():
         rev = ds.get("reverse", False)
         # apply sort quietly
         if key == "date":
-            tasks.sort(key=lambda t: parse_date(t.get("date","")) or date.max, reverse=rev)
+            tasks.sort(key=lambda t: t._date or date.max, reverse=rev)
         elif key == "name":
-            tasks.sort(key=lambda t: t["item"].lower(), reverse=rev)
+            tasks.sort(key=lambda t: t._item_lc, reverse=rev)
     notify_startup(tasks)
 
     while True:
@@ -669,7 +846,7 @@ def main():
         elif choice == "4":
             list_all(tasks, show_completed=False)
         elif choice == "5":
-            completed = [t for t in tasks if t.get("completed")]
+            completed = [t for t in tasks if t.completed]
             print_table(completed)
         elif choice == "6":
             tasks = rename_item(tasks)
@@ -700,7 +877,7 @@ def main():
             save_config(CFG)
         elif choice == "19":
             print("Creating immediate backup...")
-            make_backup(tasks)
+            make_backup(serialize_tasks(tasks))
             print("Backup created.")
         elif choice == "20":
             if CFG.get("autosave", True):